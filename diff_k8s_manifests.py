@@ -1,10 +1,108 @@
+import functools
+import hashlib
 import json
 import logging
+import math
 import os
 import sys
+from typing import Any, NamedTuple
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class _Missing:
+    """Marks a diff entry value that is not set."""
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING: Any = _Missing()
+
+
+def _json_compatible(value: Any) -> Any:
+    """
+    Returns the value with everything JSON encoders disagree on normalized.
+
+    YAML allows keys such as dates, which json.dumps rejects even with a
+    default serializer, since the default only applies to values; such keys
+    are stringified. NaN and infinity are not valid JSON and become None.
+    """
+    if isinstance(value, dict):
+        return {
+            (
+                key
+                if key is None
+                or isinstance(key, (str, int))
+                or (isinstance(key, float) and math.isfinite(key))
+                else str(key)
+            ): _json_compatible(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_json_compatible(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class DiffEntry(NamedTuple):
+    """A single removed, added or changed item of a diff."""
+
+    path: str
+    old_value: Any = _MISSING
+    new_value: Any = _MISSING
+    message: str | None = None
+
+    def to_dict(self) -> dict:
+        """Returns the entry as a dictionary, leaving out unset fields."""
+        entry = {"path": self.path}
+        if self.old_value is not _MISSING:
+            entry["old_value"] = self.old_value
+        if self.new_value is not _MISSING:
+            entry["new_value"] = self.new_value
+        if self.message is not None:
+            entry["message"] = self.message
+        return entry
+
+
+def _json_dumps(obj: Any) -> str:
+    """
+    Serializes an object to a compact JSON string.
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise, or when orjson rejects a value it cannot encode
+    (e.g. an integer wider than 64 bits). Both produce the same output:
+    compact separators, non-ASCII characters written as is, NaN and infinity
+    as null, and other values JSON cannot represent, such as dates and
+    datetimes, stringified.
+    """
+    obj = _json_compatible(obj)
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        obj, default=str, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    )
+
 
 class JSONFormatter(logging.Formatter):
     """Custom logging formatter to output logs in JSON format."""
@@ -15,7 +113,7 @@ class JSONFormatter(logging.Formatter):
             "message": record.getMessage(),
             "timestamp": self.formatTime(record, self.datefmt),
         }
-        return json.dumps(log_message)
+        return _json_dumps(log_message)
 
 
 def setup_logging() -> str:
@@ -31,8 +129,8 @@ def setup_logging() -> str:
     log_format = os.getenv("LOG_FORMAT", "text")
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
-    logger = logging.getLogger()
-    logger.setLevel(log_level)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
 
     handler = logging.StreamHandler()
 
@@ -41,103 +139,359 @@ def setup_logging() -> str:
     else:
         handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    if root_logger.hasHandlers():
+        root_logger.handlers.clear()
 
-    logger.addHandler(handler)
+    root_logger.addHandler(handler)
 
     return log_format.lower()
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(file_path: str, stat_key: tuple[int, int, int]) -> dict:
+    """
+    Parses a YAML file, memoized on its path and stat signature.
+
+    The stat signature (modification time, size and inode) is part of the
+    cache key only so that an edited or replaced file is parsed again; it is
+    not used otherwise. The returned dictionary is shared between callers and
+    must not be mutated.
+    """
+    with open(file_path, "r") as data:
+        content = yaml.load(data, Loader=SafeLoader)
+        if content is None:
+            return {}
+        return content
+
+
 def load_yaml(file_path: str) -> dict:
     """
     Loads a YAML file and returns its contents as a Python dictionary.
 
+    Repeated loads of an unchanged file are served from an in-process cache,
+    keyed on the file's modification time, size and inode.
+
     Args:
         file_path (str): The path to the YAML file.
 
     Returns:
-        dict: The contents of the YAML file as a dictionary.
+        dict: The contents of the YAML file as a dictionary. The same object is
+        returned for every load of an unchanged file, so it must not be
+        mutated; copy it (e.g. with copy.deepcopy) before making changes.
 
     Raises:
         FileNotFoundError: If the file does not exist.
         yaml.YAMLError: If there is an error in parsing the YAML file.
     """
     try:
-        with open(file_path, "r") as data:
-            content = yaml.safe_load(data)
-            return content if content is not None else {}
+        stat = os.stat(file_path)
+        return _load_yaml_cached(
+            file_path, (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        )
     except FileNotFoundError as e:
-        logging.error(
-            f"File not found: {file_path}. Please check the file path and try again."
+        logger.error(
+            "File not found: %s. Please check the file path and try again.", file_path
         )
         raise e
     except yaml.YAMLError as e:
-        logging.error(f"Failed to parse YAML file {file_path}: {e}")
+        logger.error("Failed to parse YAML file %s: %s", file_path, e)
         raise e
 
 
-def compare_state_lists(
-    current_state: list[dict], desired_state: list[dict], path: str
+def _index_by_key(items: list, unique_key: str | None) -> dict | None:
+    """
+    Indexes list items by their unique key field.
+
+    Args:
+        items (list): The list items to index.
+        unique_key (str | None): The unique key field of the list items.
+
+    Returns:
+        dict | None: The items keyed by their unique key value, or None if the
+        list has to be compared by position instead (an item is not a
+        dictionary, lacks the unique key, its value is not hashable, or two
+        items share the same value).
+    """
+    if unique_key is None:
+        return None
+
+    indexed = {}
+    for item in items:
+        if not isinstance(item, dict) or unique_key not in item:
+            return None
+        try:
+            indexed[item[unique_key]] = item
+        except TypeError:
+            return None
+
+    return indexed if len(indexed) == len(items) else None
+
+
+def _flatten_added(subtree: dict, path: str, out: list) -> None:
+    """
+    Appends an 'added' item for every leaf of a newly added dictionary.
+
+    Nested dictionaries are expanded in document order; any other value
+    (including lists and empty dictionaries) is reported as a single leaf.
+
+    Args:
+        subtree (dict): The added dictionary.
+        path (str): The path of the added dictionary in the object.
+        out (list): The list of 'added' items to append to.
+    """
+    stack: list[tuple[Any, str]] = [(subtree, path)]
+
+    while stack:
+        value, value_path = stack.pop()
+        if isinstance(value, dict) and value:
+            prefix = value_path + "."
+            stack.extend((v, prefix + str(k)) for k, v in reversed(value.items()))
+        else:
+            out.append(DiffEntry(value_path, new_value=value))
+
+
+def _compare_states(
+    current_state: dict | list,
+    desired_state: dict | list,
+    path: str,
+    diff: dict | None = None,
 ) -> dict:
     """
-    Compares two lists of dictionaries (e.g., containers in k8s specs) and
-    returns the differences (added, removed, and changed items).
+    Walks two states side by side and collects their differences.
+
+    The walk is iterative: nested dictionaries and lists are pushed onto a
+    stack as (current, desired, path) work items instead of being compared
+    recursively, and every difference is appended straight to a single diff.
+    Each node pushes its work items and pending differences in reverse, so the
+    stack replays them depth-first and the diff lists the differences in
+    document order. Equal states are detected once up front, and equal child
+    subtrees (using the built-in ==) are skipped before they are pushed, so
+    every pushed node is known to differ.
+
+    Lists are matched by the unique key field of their items; lists without a
+    usable unique key (e.g. `args` or `command`) are compared by position.
+
+    Added keys are found with a single key-view set difference, so the
+    desired side is only scanned again (in its original order, to keep the
+    output stable) when something was actually added.
 
     Args:
-        current_state (list[dict]): The current state list.
-        desired_state (list[dict]): The desired state list.
-        path (str): The path of the list in the object (used for detailed diffs).
+        current_state (dict | list): The current state dictionary or list.
+        desired_state (dict | list): The desired state dictionary or list.
+        path (str): The path of the state in the object (used for detailed diffs).
+        diff (dict | None, optional): The diff to append the differences to.
+            Defaults to a new, empty diff.
 
     Returns:
         dict: A dictionary containing the 'removed', 'added', and 'changed' items.
     """
-    diff = {"removed": [], "added": [], "changed": []}
-
-    if not current_state:
-        diff["removed"].append({"path": path, "message": "Current state list is empty"})
-        return diff
+    if diff is None:
+        diff = {"removed": [], "added": [], "changed": []}
+    add_removed = diff["removed"].append
+    add_added = diff["added"].append
+    add_changed = diff["changed"].append
 
-    if not desired_state:
-        diff["added"].append({"path": path, "message": "Desired state list is empty"})
+    if current_state is desired_state or current_state == desired_state:
         return diff
 
-    unique_key = (
-        "name" if "name" in current_state[0] else list(current_state[0].keys())[0]
-    )
+    # Work items are either (current, desired, path) nodes to compare or
+    # (append, entry) pairs recording a difference once the stack reaches it.
+    work: list[tuple[Any, ...]] = [(current_state, desired_state, path)]
+
+    while work:
+        item = work.pop()
+        if len(item) == 2:
+            item[0](item[1])
+            continue
+
+        current, desired, node_path = item
+        pending: list[tuple[Any, ...]] = []
+
+        if isinstance(current, list):
+            if not current:
+                add_removed(DiffEntry(node_path, message="Current state list is empty"))
+                continue
+
+            if not desired:
+                add_added(DiffEntry(node_path, message="Desired state list is empty"))
+                continue
+
+            bracket = node_path + "["
+            first = current[0]
+            unique_key = None
+            if isinstance(first, dict) and first:
+                unique_key = "name" if "name" in first else next(iter(first))
+
+            current_dict = _index_by_key(current, unique_key)
+            desired_dict = _index_by_key(desired, unique_key)
+
+            if current_dict is None or desired_dict is None:
+                for index, (current_item, desired_item) in enumerate(
+                    zip(current, desired)
+                ):
+                    if current_item == desired_item:
+                        continue
+                    item_path = bracket + str(index) + "]"
+                    if type(current_item) is type(desired_item) and isinstance(
+                        current_item, (dict, list)
+                    ):
+                        pending.append((current_item, desired_item, item_path))
+                    else:
+                        pending.append(
+                            (
+                                add_changed,
+                                DiffEntry(
+                                    item_path,
+                                    old_value=current_item,
+                                    new_value=desired_item,
+                                ),
+                            )
+                        )
+
+                for index in range(len(desired), len(current)):
+                    pending.append(
+                        (
+                            add_removed,
+                            DiffEntry(
+                                bracket + str(index) + "]", old_value=current[index]
+                            ),
+                        )
+                    )
+
+                for index in range(len(current), len(desired)):
+                    pending.append(
+                        (
+                            add_added,
+                            DiffEntry(
+                                bracket + str(index) + "]", new_value=desired[index]
+                            ),
+                        )
+                    )
+            else:
+                changed_items = []
+                for key in current_dict:
+                    if key not in desired_dict:
+                        pending.append(
+                            (
+                                add_removed,
+                                DiffEntry(
+                                    bracket + str(key) + "]",
+                                    old_value=current_dict[key],
+                                ),
+                            )
+                        )
+                    elif current_dict[key] != desired_dict[key]:
+                        changed_items.append(
+                            (
+                                current_dict[key],
+                                desired_dict[key],
+                                bracket + str(key) + "]",
+                            )
+                        )
+
+                added_keys = desired_dict.keys() - current_dict.keys()
+                if added_keys:
+                    for key in desired_dict:
+                        if key in added_keys:
+                            pending.append(
+                                (
+                                    add_added,
+                                    DiffEntry(
+                                        bracket + str(key) + "]",
+                                        new_value=desired_dict[key],
+                                    ),
+                                )
+                            )
+
+                pending.extend(changed_items)
+
+            work.extend(reversed(pending))
+            continue
+
+        logger.debug(
+            "Comparing current: %s with desired: %s at path: %s",
+            current,
+            desired,
+            node_path,
+        )
 
-    current_state_dict = {item[unique_key]: item for item in current_state}
-    desired_state_dict = {item[unique_key]: item for item in desired_state}
+        prefix = node_path + "." if node_path else ""
 
-    for key in current_state_dict:
-        if key not in desired_state_dict:
-            diff["removed"].append(
-                {"path": f"{path}[{key}]", "old_value": current_state_dict[key]}
-            )
+        for key in current:
+            key_path = prefix + str(key)
+            logger.debug("Processing key '%s' with path '%s'", key, key_path)
+            if key not in desired:
+                logger.debug("Key '%s' removed. Path: %s", key, key_path)
+                pending.append(
+                    (add_removed, DiffEntry(key_path, old_value=current[key]))
+                )
+            elif current[key] == desired[key]:
+                continue
+            elif type(current[key]) is type(desired[key]) and isinstance(
+                current[key], (dict, list)
+            ):
+                pending.append((current[key], desired[key], key_path))
+            else:
+                logger.debug("Key '%s' changed at path: %s", key, key_path)
+                pending.append(
+                    (
+                        add_changed,
+                        DiffEntry(
+                            key_path, old_value=current[key], new_value=desired[key]
+                        ),
+                    )
+                )
 
-    for key in desired_state_dict:
-        if key not in current_state_dict:
-            diff["added"].append(
-                {"path": f"{path}[{key}]", "new_value": desired_state_dict[key]}
-            )
+        added_keys = desired.keys() - current.keys()
+        if added_keys:
+            for key in desired:
+                if key in added_keys:
+                    key_path = prefix + str(key)
+                    logger.debug("Key '%s' added. Path: %s", key, key_path)
+                    if isinstance(desired[key], dict):
+                        flattened: list[DiffEntry] = []
+                        _flatten_added(desired[key], key_path, flattened)
+                        pending.append((diff["added"].extend, flattened))
+                    else:
+                        pending.append(
+                            (add_added, DiffEntry(key_path, new_value=desired[key]))
+                        )
 
-    for key in current_state_dict:
-        if (
-            key in desired_state_dict
-            and current_state_dict[key] != desired_state_dict[key]
-        ):
-            sub_diff = compare_state_dicts(
-                current_state_dict[key], desired_state_dict[key], f"{path}[{key}]"
-            )
-            diff["removed"].extend(sub_diff["removed"])
-            diff["added"].extend(sub_diff["added"])
-            diff["changed"].extend(sub_diff["changed"])
+        work.extend(reversed(pending))
 
+    logger.debug("Diff for path '%s': %s", path, diff)
     return diff
 
 
+def compare_state_lists(
+    current_state: list[dict],
+    desired_state: list[dict],
+    path: str,
+    diff: dict | None = None,
+) -> dict:
+    """
+    Compares two lists of dictionaries (e.g., containers in k8s specs) and
+    returns the differences (added, removed, and changed items).
+
+    Args:
+        current_state (list[dict]): The current state list.
+        desired_state (list[dict]): The desired state list.
+        path (str): The path of the list in the object (used for detailed diffs).
+        diff (dict | None, optional): The diff to append the differences to,
+            e.g. to collect several comparisons into one diff. Defaults to a
+            new, empty diff.
+
+    Returns:
+        dict: A dictionary containing the 'removed', 'added', and 'changed' items.
+    """
+    return _compare_states(current_state, desired_state, path, diff)
+
+
 def compare_state_dicts(
-    current_state: dict, desired_state: dict, path: str = ""
+    current_state: dict,
+    desired_state: dict,
+    path: str = "",
+    diff: dict | None = None,
 ) -> dict:
     """
     Compares two dictionaries (e.g., Kubernetes manifest YAML) and returns
@@ -147,64 +501,14 @@ def compare_state_dicts(
         current_state (dict): The current state dictionary.
         desired_state (dict): The desired state dictionary.
         path (str, optional): The path in the object (used for detailed diffs). Defaults to "".
+        diff (dict | None, optional): The diff to append the differences to,
+            e.g. to collect several comparisons into one diff. Defaults to a
+            new, empty diff.
 
     Returns:
         dict: A dictionary containing the 'removed', 'added', and 'changed' items.
     """
-    diff = {"removed": [], "added": [], "changed": []}
-
-    logging.debug(
-        f"Comparing current: {current_state} with desired: {desired_state} at path: {path}"
-    )
-
-    for key in current_state:
-        key_path = f"{path}.{key}" if path else key
-        logging.debug(f"Processing key '{key}' with path '{key_path}'")
-        if key not in desired_state:
-            logging.debug(f"Key '{key}' removed. Path: {key_path}")
-            diff["removed"].append({"path": key_path, "old_value": current_state[key]})
-        elif isinstance(current_state[key], dict) and isinstance(
-            desired_state[key], dict
-        ):
-            sub_diff = compare_state_dicts(
-                current_state[key], desired_state[key], key_path
-            )
-            diff["removed"].extend(sub_diff["removed"])
-            diff["added"].extend(sub_diff["added"])
-            diff["changed"].extend(sub_diff["changed"])
-        elif isinstance(current_state[key], list) and isinstance(
-            desired_state[key], list
-        ):
-            sub_diff = compare_state_lists(
-                current_state[key], desired_state[key], key_path
-            )
-            diff["removed"].extend(sub_diff["removed"])
-            diff["added"].extend(sub_diff["added"])
-            diff["changed"].extend(sub_diff["changed"])
-        elif current_state[key] != desired_state[key]:
-            logging.debug(f"Key '{key}' changed at path: {key_path}")
-            diff["changed"].append(
-                {
-                    "path": key_path,
-                    "old_value": current_state[key],
-                    "new_value": desired_state[key],
-                }
-            )
-
-    for key in desired_state:
-        key_path = f"{path}.{key}" if path else key
-        if key not in current_state:
-            logging.debug(f"Key '{key}' added. Path: {key_path}")
-            if isinstance(desired_state[key], dict):
-                sub_diff = compare_state_dicts({}, desired_state[key], key_path)
-                diff["added"].extend(sub_diff["added"])
-            else:
-                diff["added"].append(
-                    {"path": key_path, "new_value": desired_state[key]}
-                )
-
-    logging.debug(f"Diff for path '{path}': {diff}")
-    return diff
+    return _compare_states(current_state, desired_state, path, diff)
 
 
 def check_mismatches(
@@ -228,8 +532,11 @@ def check_mismatches(
         desired_value = desired_state.get(field)
 
         if current_value != desired_value:
-            logging.warning(
-                f"'{field}' mismatch. Current: {current_value}, Desired: {desired_value}"
+            logger.warning(
+                "'%s' mismatch. Current: %s, Desired: %s",
+                field,
+                current_value,
+                desired_value,
             )
             mismatches[field] = True
         else:
@@ -246,31 +553,64 @@ def get_diff_summary(diff: dict) -> dict:
         diff (dict): The diff containing 'removed', 'added', and 'changed' items.
 
     Returns:
-        dict: A summary of the differences.
+        dict: A summary of the differences, mapping each change type to a list
+        of (path, value) tuples.
     """
     summary = {}
 
     if diff["removed"]:
         summary["removed"] = [
-            f"{item['path']}: {yaml.dump(item.get('old_value', '')).strip()}"
+            (item.path, "" if item.old_value is _MISSING else item.old_value)
             for item in diff["removed"]
         ]
 
     if diff["added"]:
         summary["added"] = [
-            f"{item['path']}: {yaml.dump(item['new_value'], default_flow_style=False).strip()}"
+            (item.path, "" if item.new_value is _MISSING else item.new_value)
             for item in diff["added"]
         ]
 
     if diff["changed"]:
         summary["changed"] = [
-            f"{item['path']}: old value: {item['old_value']}, new value: {item['new_value']}"
+            (
+                item.path,
+                f"old value: {item.old_value}, new value: {item.new_value}",
+            )
             for item in diff["changed"]
         ]
 
     return summary
 
 
+def _files_identical(file_current: str, file_desired: str) -> bool:
+    """
+    Checks whether two files have byte-identical contents.
+
+    Files of different sizes are told apart without reading them; otherwise
+    their SHA-256 digests are compared.
+
+    Args:
+        file_current (str): The path to the current state YAML file.
+        file_desired (str): The path to the desired state YAML file.
+
+    Returns:
+        bool: True if both files have the same contents, False otherwise or if
+        either file cannot be read.
+    """
+    try:
+        if os.path.samefile(file_current, file_desired):
+            return True
+        if os.path.getsize(file_current) != os.path.getsize(file_desired):
+            return False
+        with open(file_current, "rb") as current, open(file_desired, "rb") as desired:
+            return (
+                hashlib.file_digest(current, "sha256").digest()
+                == hashlib.file_digest(desired, "sha256").digest()
+            )
+    except OSError:
+        return False
+
+
 def print_diff(file_current: str, file_desired: str, output_format: str) -> None:
     """
     Compares two Kubernetes manifests and outputs the differences.
@@ -278,72 +618,72 @@ def print_diff(file_current: str, file_desired: str, output_format: str) -> None
     Args:
         file_current (str): The path to the current state YAML file.
         file_desired (str): The path to the desired state YAML file.
-        output_format (str): The output format ("json" or "text").
+        output_format (str): The output format ("json" or "text"). JSON output
+            is the raw diff; text output is a YAML-formatted summary.
     """
+    identical = _files_identical(file_current, file_desired)
     try:
         current_state = load_yaml(file_current)
-        desired_state = load_yaml(file_desired)
+        # Parsing one of two identical files still reports a malformed one.
+        desired_state = current_state if identical else load_yaml(file_desired)
     except FileNotFoundError:
         sys.exit(1)
 
-    fields_to_check = ["kind", "apiVersion"]
-    check_mismatches(current_state, desired_state, fields_to_check)
+    if identical:
+        diff: dict = {"removed": [], "added": [], "changed": []}
+    else:
+        fields_to_check = ["kind", "apiVersion"]
+        check_mismatches(current_state, desired_state, fields_to_check)
 
-    diff = compare_state_dicts(current_state, desired_state)
+        diff = compare_state_dicts(current_state, desired_state)
 
-    summary = get_diff_summary(diff)
+    if not diff["removed"] and not diff["added"] and not diff["changed"]:
+        logger.info("No differences found.")
+        return
 
-    if (
-        not summary.get("removed")
-        and not summary.get("added")
-        and not summary.get("changed")
-    ):
-        logging.info("No differences found.")
+    if output_format == "json":
+        entries = {
+            change_type: [item.to_dict() for item in items]
+            for change_type, items in diff.items()
+        }
+        logger.info(_json_dumps(entries))
+        return
+
+    summary = get_diff_summary(diff)
 
     def format_changes(change_type: str, changes: list) -> str:
         """Formats the changes for text output."""
         output = f"The following items were {change_type}:\n"
-        for item in changes:
-            parts = item.split(":", 1)
-            path = parts[0].strip()
-            value = parts[1].strip() if len(parts) > 1 else ""
+        for path, value in changes:
             output += f"  {path}:\n"
-            if value:
-                try:
-                    value_dict = yaml.safe_load(value)
-                    if isinstance(value_dict, dict):
-                        for k, v in value_dict.items():
-                            output += f"    {k}: {v}\n"
-                    else:
-                        output += f"    {value_dict}\n"
-                except yaml.YAMLError:
-                    output += f"    {value}\n"
+            if isinstance(value, dict):
+                for k, v in value.items():
+                    output += f"    {k}: {v}\n"
+            elif value != "":
+                output += f"    {value}\n"
         return output
 
-    if output_format == "json":
-        logging.info(summary)
-    else:
-        output = ""
+    output = ""
 
-        if summary.get("removed"):
-            output += format_changes("removed", summary["removed"])
+    if summary.get("removed"):
+        output += format_changes("removed", summary["removed"])
 
-        if summary.get("added"):
-            output += format_changes("added", summary["added"])
+    if summary.get("added"):
+        output += format_changes("added", summary["added"])
 
-        if summary.get("changed"):
-            output += format_changes("changed", summary["changed"])
+    if summary.get("changed"):
+        output += format_changes("changed", summary["changed"])
 
-        if output:
-            logging.info(output.strip())
+    if output:
+        logger.info(output.strip())
 
 
 if __name__ == "__main__":
     log_format = setup_logging()
 
     if len(sys.argv) < 3:
-        logging.error(
-            f"Usage: python {sys.argv[0]} <current_state.yaml> <desired_state.yaml>"
+        logger.error(
+            "Usage: python %s <current_state.yaml> <desired_state.yaml>", sys.argv[0]
         )
         sys.exit(1)
 
@@ -353,5 +693,5 @@ if __name__ == "__main__":
     try:
         print_diff(file_current, file_desired, log_format)
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
         sys.exit(1)
@@ -1,15 +1,22 @@
+import os
 from io import StringIO
 
 import pytest
 import yaml
 
-from diff_k8s_manifests import check_mismatches, compare_state_dicts, load_yaml
+from diff_k8s_manifests import (
+    SafeLoader,
+    check_mismatches,
+    compare_state_dicts,
+    compare_state_lists,
+    load_yaml,
+)
 
 
 @pytest.fixture
 def load_yaml_mock():
     def _load_yaml_mock(yaml_string):
-        content = yaml.safe_load(StringIO(yaml_string))
+        content = yaml.load(StringIO(yaml_string), Loader=SafeLoader)
         return content if content is not None else {}
 
     return _load_yaml_mock
@@ -20,6 +27,20 @@ def test_no_file():
         load_yaml("non_existent_file.yaml")
 
 
+def test_load_yaml_cache(tmp_path):
+    manifest = tmp_path / "manifest.yaml"
+    manifest.write_text("kind: Deployment\n")
+
+    first = load_yaml(str(manifest))
+    assert load_yaml(str(manifest)) is first
+
+    mtime_ns = os.stat(manifest).st_mtime_ns
+    manifest.write_text("kind: StatefulSet\n")
+    os.utime(manifest, ns=(mtime_ns, mtime_ns))
+
+    assert load_yaml(str(manifest)) == {"kind": "StatefulSet"}
+
+
 def test_empty_files(load_yaml_mock):
     current_state = load_yaml_mock("")
     desired_state = load_yaml_mock("")
@@ -57,8 +78,8 @@ def test_something_added(load_yaml_mock):
     diff = compare_state_dicts(current_state, desired_state)
 
     assert len(diff["added"]) == 1
-    added_path = [d["path"] for d in diff["added"]]
-    added_value = [d["new_value"] for d in diff["added"]]
+    added_path = [d.path for d in diff["added"]]
+    added_value = [d.new_value for d in diff["added"]]
 
     assert "spec.template.spec.containers[nginx]" in added_path or added_value[0] == [
         {"name": "nginx", "image": "nginx:1.16.3"}
@@ -91,8 +112,8 @@ def test_something_deleted(load_yaml_mock):
     diff = compare_state_dicts(current_state, desired_state)
 
     assert len(diff["removed"]) == 1
-    removed_path = [d["path"] for d in diff["removed"]]
-    removed_value = [d["old_value"] for d in diff["removed"]]
+    removed_path = [d.path for d in diff["removed"]]
+    removed_value = [d.old_value for d in diff["removed"]]
 
     expected_removed_value = {
         "spec": {"containers": [{"name": "nginx", "image": "nginx:1.16.3"}]}
@@ -124,7 +145,7 @@ def test_something_changed(load_yaml_mock):
 
     assert not diff["added"]
     assert len(diff["changed"]) == 1
-    assert "spec.replicas" in [d["path"] for d in diff["changed"]]
+    assert "spec.replicas" in [d.path for d in diff["changed"]]
 
 
 def test_no_diff_found(load_yaml_mock):
@@ -145,6 +166,21 @@ def test_no_diff_found(load_yaml_mock):
     assert not diff["changed"]
 
 
+def test_no_diff_found_in_lists():
+    containers = [{"name": "nginx", "image": "nginx:1.16.3"}]
+
+    for current_state, desired_state in (
+        ([], []),
+        (containers, containers),
+        (containers, [dict(item) for item in containers]),
+    ):
+        diff = compare_state_lists(current_state, desired_state, "containers")
+
+        assert not diff["added"]
+        assert not diff["removed"]
+        assert not diff["changed"]
+
+
 def test_multi_crud(load_yaml_mock):
     current = """
     kind: Deployment
@@ -184,15 +220,128 @@ def test_multi_crud(load_yaml_mock):
     diff = compare_state_dicts(current_state, desired_state)
 
     assert "spec.template.spec.containers[nginx].env[MESSAGE_BROKER_HOST]" in [
-        d["path"] for d in diff["added"]
+        d.path for d in diff["added"]
     ]
-    assert "spec.replicas" in [d["path"] for d in diff["changed"]]
+    assert "spec.replicas" in [d.path for d in diff["changed"]]
     assert "spec.template.spec.containers[nginx].image" in [
-        d["path"] for d in diff["changed"]
+        d.path for d in diff["changed"]
     ]
     assert "spec.template.spec.containers[nginx].env[DATABASE_HOST].value" in [
-        d["path"] for d in diff["changed"]
+        d.path for d in diff["changed"]
+    ]
+
+
+def test_positional_list(load_yaml_mock):
+    current = """
+    spec:
+      containers:
+        - name: nginx
+          args: ["--port", "80", "--verbose"]
+    """
+
+    desired = """
+    spec:
+      containers:
+        - name: nginx
+          args: ["--port", "8080"]
+    """
+
+    current_state = load_yaml_mock(current)
+    desired_state = load_yaml_mock(desired)
+
+    diff = compare_state_dicts(current_state, desired_state)
+
+    assert not diff["added"]
+    assert [d.path for d in diff["changed"]] == ["spec.containers[nginx].args[1]"]
+    assert diff["changed"][0].new_value == "8080"
+    assert [d.path for d in diff["removed"]] == ["spec.containers[nginx].args[2]"]
+
+
+def test_unhashable_unique_key(load_yaml_mock):
+    current = """
+    nodeSelectorTerms:
+      - matchExpressions:
+          - key: zone
+            operator: In
+            values: [a]
+    """
+
+    desired = """
+    nodeSelectorTerms:
+      - matchExpressions:
+          - key: zone
+            operator: In
+            values: [b]
+    """
+
+    current_state = load_yaml_mock(current)
+    desired_state = load_yaml_mock(desired)
+
+    diff = compare_state_dicts(current_state, desired_state)
+
+    assert not diff["added"]
+    assert not diff["removed"]
+    assert [d.path for d in diff["changed"]] == [
+        "nodeSelectorTerms[0].matchExpressions[zone].values[0]"
+    ]
+
+
+def test_shared_diff():
+    diff = compare_state_dicts({"replicas": 1}, {"replicas": 3}, "spec")
+    shared = compare_state_lists(
+        [{"name": "nginx", "image": "nginx:1.14.2"}],
+        [{"name": "nginx", "image": "nginx:1.16.3"}],
+        "containers",
+        diff,
+    )
+
+    assert shared is diff
+    assert [d.path for d in diff["changed"]] == [
+        "spec.replicas",
+        "containers[nginx].image",
+    ]
+
+
+def test_diff_order(load_yaml_mock):
+    current = """
+    metadata:
+      labels:
+        app: nginx
+    spec:
+      replicas: 1
+      template:
+        spec:
+          containers:
+            - name: nginx
+              image: nginx:1.14.2
+    """
+
+    desired = """
+    metadata:
+      labels:
+        app: web
+        tier: frontend
+    spec:
+      replicas: 3
+      template:
+        spec:
+          containers:
+            - name: nginx
+              image: nginx:1.16.3
+      paused: true
+    """
+
+    current_state = load_yaml_mock(current)
+    desired_state = load_yaml_mock(desired)
+
+    diff = compare_state_dicts(current_state, desired_state)
+
+    assert [d.path for d in diff["changed"]] == [
+        "metadata.labels.app",
+        "spec.replicas",
+        "spec.template.spec.containers[nginx].image",
     ]
+    assert [d.path for d in diff["added"]] == ["metadata.labels.tier", "spec.paused"]
 
 
 def test_mismatches(load_yaml_mock):
@@ -251,7 +400,7 @@ def test_create_object(load_yaml_mock):
     diff = compare_state_dicts(current_state, desired_state)
 
     assert len(diff["added"]) == 4
-    added_paths = [d["path"] for d in diff["added"]]
+    added_paths = [d.path for d in diff["added"]]
     assert "kind" in added_paths
     assert "apiVersion" in added_paths
     assert "spec.replicas" in added_paths
@@ -278,7 +427,7 @@ def test_delete_object(load_yaml_mock):
     diff = compare_state_dicts(current_state, desired_state)
 
     assert len(diff["removed"]) == 3
-    removed_paths = [d["path"] for d in diff["removed"]]
+    removed_paths = [d.path for d in diff["removed"]]
     assert "kind" in removed_paths
     assert "apiVersion" in removed_paths
     assert "spec" in removed_paths
@@ -314,4 +463,4 @@ def test_kind_change(load_yaml_mock):
     diff = compare_state_dicts(current_state, desired_state)
 
     assert len(diff["changed"]) == 1
-    assert "kind" in [d["path"] for d in diff["changed"]]
+    assert "kind" in [d.path for d in diff["changed"]]
@@ -1,9 +1,15 @@
+import json
+import logging
+import shutil
+
 import pytest
+import yaml
 
-from diff_k8s_manifests import compare_state_dicts, load_yaml
+import diff_k8s_manifests
+from diff_k8s_manifests import compare_state_dicts, load_yaml, print_diff
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def load_yaml_file():
     def _load_yaml_file(file_name):
         return load_yaml(f"tests/{file_name}")
@@ -21,10 +27,9 @@ def test_compare_config_file_1_and_2(load_yaml_file):
     assert len(diff["removed"]) > 0
     assert len(diff["changed"]) > 0
 
-    assert any(d["path"] == "spec.replicas" for d in diff["changed"])
+    assert any(d.path == "spec.replicas" for d in diff["changed"])
     assert any(
-        d["path"] == "spec.template.spec.containers[nginx].image"
-        for d in diff["changed"]
+        d.path == "spec.template.spec.containers[nginx].image" for d in diff["changed"]
     )
 
 
@@ -39,11 +44,10 @@ def test_compare_config_file_2_and_3(load_yaml_file):
     assert len(diff["changed"]) > 0
 
     assert any(
-        d["path"] == "spec.template.spec.containers[nginx].image"
-        for d in diff["changed"]
+        d.path == "spec.template.spec.containers[nginx].image" for d in diff["changed"]
     )
     assert any(
-        d["path"] == "spec.template.spec.containers[nginx].resources.limits.memory"
+        d.path == "spec.template.spec.containers[nginx].resources.limits.memory"
         for d in diff["added"]
     )
 
@@ -58,12 +62,119 @@ def test_compare_config_file_1_and_3(load_yaml_file):
     assert len(diff["removed"]) > 0
     assert len(diff["changed"]) > 0
 
-    assert any(d["path"] == "spec.replicas" for d in diff["changed"])
+    assert any(d.path == "spec.replicas" for d in diff["changed"])
     assert any(
-        d["path"] == "spec.template.spec.containers[nginx].image"
-        for d in diff["changed"]
+        d.path == "spec.template.spec.containers[nginx].image" for d in diff["changed"]
     )
     assert any(
-        d["path"] == "spec.template.spec.containers[nginx].resources.limits.memory"
+        d.path == "spec.template.spec.containers[nginx].resources.limits.memory"
         for d in diff["added"]
     )
+
+
+def test_print_diff_json(caplog):
+    with caplog.at_level(logging.INFO):
+        print_diff("tests/config_file_1.yaml", "tests/config_file_2.yaml", "json")
+
+    diff = json.loads(caplog.records[-1].getMessage())
+
+    assert {"path": "spec.replicas", "old_value": 1, "new_value": 3} in diff["changed"]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(diff_k8s_manifests, "orjson", None)
+    return request.param
+
+
+def test_print_diff_json_values(caplog, tmp_path, json_backend):
+    current = tmp_path / "current.yaml"
+    desired = tmp_path / "desired.yaml"
+    current.write_text(
+        "ann:\n  2020-01-01: v\ncreated: 2020-01-01 00:00:00\n"
+        "name: cafe\nratio: .nan\n"
+    )
+    desired.write_text("created: 2021-01-01 00:00:00\nname: café\nratio: 1.5\n")
+
+    with caplog.at_level(logging.INFO):
+        print_diff(str(current), str(desired), "json")
+
+    assert caplog.records[-1].getMessage() == (
+        '{"removed":[{"path":"ann","old_value":{"2020-01-01":"v"}}],'
+        '"added":[],'
+        '"changed":['
+        '{"path":"created","old_value":"2020-01-01 00:00:00",'
+        '"new_value":"2021-01-01 00:00:00"},'
+        '{"path":"name","old_value":"cafe","new_value":"café"},'
+        '{"path":"ratio","old_value":null,"new_value":1.5}]}'
+    )
+
+
+def test_print_diff_json_big_int(caplog, tmp_path, json_backend):
+    current = tmp_path / "current.yaml"
+    desired = tmp_path / "desired.yaml"
+    current.write_text("ann:\n  2020-01-01: v\nsize: 1\n")
+    desired.write_text("size: 1180591620717411303424\n")
+
+    with caplog.at_level(logging.INFO):
+        print_diff(str(current), str(desired), "json")
+
+    assert caplog.records[-1].getMessage() == (
+        '{"removed":[{"path":"ann","old_value":{"2020-01-01":"v"}}],'
+        '"added":[],'
+        '"changed":[{"path":"size","old_value":1,"new_value":1180591620717411303424}]}'
+    )
+
+
+def test_print_diff_text(caplog):
+    with caplog.at_level(logging.INFO):
+        print_diff("tests/config_file_1.yaml", "tests/config_file_2.yaml", "text")
+
+    output = caplog.records[-1].getMessage()
+
+    assert (
+        "  spec.template.spec.containers[nginx].env[MESSAGE_BROKER_HOST]:\n"
+        "    name: MESSAGE_BROKER_HOST\n"
+        "    value: kfk1.example.com\n"
+    ) in output
+    assert "  spec.replicas:\n    old value: 1, new value: 3" in output
+
+
+def test_print_diff_identical_files(caplog, tmp_path):
+    copy = tmp_path / "config_file_1.yaml"
+    shutil.copyfile("tests/config_file_1.yaml", copy)
+
+    with caplog.at_level(logging.DEBUG, logger="diff_k8s_manifests"):
+        print_diff("tests/config_file_1.yaml", str(copy), "text")
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "No differences found."
+    ]
+
+
+def test_print_diff_identical_invalid_files(caplog, tmp_path):
+    invalid = tmp_path / "invalid.yaml"
+    invalid.write_text("kind: [unclosed\n")
+    copy = tmp_path / "copy.yaml"
+    shutil.copyfile(invalid, copy)
+
+    with pytest.raises(yaml.YAMLError):
+        print_diff(str(invalid), str(copy), "text")
+
+    assert "Failed to parse YAML file" in caplog.records[-1].getMessage()
+
+
+def test_print_diff_equivalent_files(caplog, tmp_path):
+    reformatted = tmp_path / "config_file_1.yaml"
+    with open("tests/config_file_1.yaml") as original:
+        reformatted.write_text("---\n" + original.read())
+
+    with caplog.at_level(logging.INFO):
+        print_diff("tests/config_file_1.yaml", str(reformatted), "text")
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "No differences found."
+    ]